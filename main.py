@@ -11,65 +11,272 @@ Usage:
 If output_directory is not specified, './crawled_data' will be used.
 
 Requirements:
-    pip install requests beautifulsoup4 urllib3
+    pip install aiohttp selectolax
+    pip install brotli  (optional, enables brotli transport compression)
 """
 
 import os
 import sys
-import time
 import re
-import random
+import math
+import time
+import zlib
+import queue
+import shelve
+import hashlib
+import logging
+import logging.handlers
+import itertools
 import argparse
+import asyncio
 from urllib.parse import urlparse, urljoin
-from html.parser import HTMLParser
 from collections import deque
-import threading
-import queue
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 
-import requests
-from bs4 import BeautifulSoup
-from requests.exceptions import RequestException
+import aiohttp
+from selectolax.parser import HTMLParser
 
+logger = logging.getLogger(__name__)
 
-class HTMLTextExtractor(HTMLParser):
-    """HTML Parser that extracts text from HTML content."""
-    
-    def __init__(self):
-        super().__init__()
-        self.result = []
-        self.skip_tags = {'style', 'script', 'meta', 'head', 'title', 'link'}
-        self.current_tag = None
-    
-    def handle_starttag(self, tag, attrs):
-        self.current_tag = tag
-    
-    def handle_endtag(self, tag):
-        if tag == self.current_tag:
-            self.current_tag = None
-    
-    def handle_data(self, data):
-        if self.current_tag not in self.skip_tags:
-            text = data.strip()
-            if text:
-                self.result.append(text)
-    
-    def get_text(self):
-        return '\n'.join(self.result)
+# urlparse is pure Python and allocates a namedtuple per call; the same URL
+# is parsed by validation and again for its filename, so memoize the result
+_urlparse = lru_cache(maxsize=65536)(urlparse)
+
+# Extensions the crawler never downloads; str.endswith on a tuple is a
+# single C-level call instead of a Python generator over each suffix
+_SKIP_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.pdf',
+                    '.zip', '.tar', '.gz', '.mp3', '.mp4',
+                    '.avi', '.mov', '.css', '.js')
+
+# Characters not allowed in output filenames, compiled once
+_UNSAFE_CHARS_RE = re.compile(r'[^a-zA-Z0-9_-]')
+
+# Only advertise brotli when aiohttp can actually decode it
+try:
+    import brotli  # noqa: F401
+    _ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    _ACCEPT_ENCODING = 'gzip, deflate'
 
+# Combined href pattern scanned once over the raw page bytes. Compiled with
+# google-re2 when installed: its DFA engine runs in linear time over bytes,
+# unlike the stdlib backtracking engine; the stdlib re is the fallback.
+# re2 takes an Options instance, not stdlib re flags, so each engine gets
+# its own compile; any re2 failure falls back rather than breaking import.
+_HREF_PATTERN = rb'<a\b[^>]*\bhref\s*=\s*["\']([^"\']+)["\']'
+try:
+    import re2
+    _re2_opts = re2.Options()
+    _re2_opts.case_sensitive = False
+    _re2_opts.encoding = re2.Options.Encoding.LATIN1
+    _HREF_RE = re2.compile(_HREF_PATTERN, _re2_opts)
+except Exception:
+    _HREF_RE = re.compile(_HREF_PATTERN, re.IGNORECASE)
 
-def extract_text_from_html(html_content):
+
+def _stable_hash(text):
+    """Short stable hash for filenames; crc32 runs in C and, unlike the
+    built-in hash(), gives the same value across interpreter runs so
+    filenames are reproducible between crawls."""
+    return zlib.crc32(text.encode('utf-8')) & 0x3FFF
+
+
+def is_valid_url(url, domain):
+    """Check if the URL is valid and belongs to the target domain."""
+    try:
+        # Parse the URL (cached)
+        parsed_url = _urlparse(url)
+
+        # Check if the URL has the same domain
+        if parsed_url.netloc != domain:
+            return False
+
+        # Check if the URL scheme is http or https
+        if parsed_url.scheme not in ['http', 'https']:
+            return False
+
+        # Avoid common non-HTML resources
+        if parsed_url.path.lower().endswith(_SKIP_EXTENSIONS):
+            return False
+
+        return True
+    except:
+        return False
+
+
+def parse_page(html_content, url, domain):
     """
-    Extract text from HTML content.
-    
+    Parse the HTML once and return both its text and its in-domain links.
+
+    A module-level function (rather than a WebCrawler method) so it can be
+    pickled and run in parse-pool worker processes.
+
     Args:
-        html_content (str): HTML content
-        
+        html_content (str or bytes): HTML content
+        url (str): URL the content was fetched from (for resolving links)
+        domain (str): Domain the crawl is confined to
+
     Returns:
-        str: Extracted text
+        tuple: (extracted text, set of valid absolute links)
     """
-    parser = HTMLTextExtractor()
-    parser.feed(html_content)
-    return parser.get_text()
+    links = set()
+    text = ''
+    try:
+        tree = HTMLParser(html_content)
+
+        # Fast path: scan the raw bytes for hrefs in one regex pass; fall
+        # back to walking the anchor tags for pages where the scan finds
+        # nothing (e.g. unusual attribute quoting)
+        if isinstance(html_content, bytes):
+            hrefs = [m.group(1).decode('utf-8', errors='replace')
+                     for m in _HREF_RE.finditer(html_content)]
+        else:
+            hrefs = []
+        if not hrefs:
+            hrefs = [a_tag.attributes.get('href')
+                     for a_tag in tree.tags('a')]
+
+        for link in hrefs:
+            if not link:
+                continue
+
+            # Convert relative URLs to absolute URLs
+            absolute_link = urljoin(url, link)
+
+            # Check if the URL is valid
+            if is_valid_url(absolute_link, domain):
+                links.add(absolute_link)
+
+        # Strip non-content tags, then pull the visible text
+        for node in tree.css('script, style, meta, head, title, link'):
+            node.decompose()
+        if tree.body:
+            text = tree.body.text(separator='\n', strip=True)
+    except Exception as e:
+        # Runs in parse-pool processes, where the parent's queue-based log
+        # handler isn't available; write straight to the shared terminal
+        print(f"Error parsing {url}: {e}")
+
+    return text, links
+
+
+class BloomFilter:
+    """Space-efficient set membership test with a bounded false-positive rate.
+
+    Stores a few bits per entry instead of the ~200 bytes a Python set
+    spends per URL string, so visited-URL tracking stays small even on
+    crawls with millions of pages. False positives make the crawler skip
+    a URL it has never seen, which is an acceptable trade for dedup.
+    """
+
+    def __init__(self, capacity=1000000, error_rate=1e-6):
+        # Optimal sizing: m = -n*ln(p)/ln(2)^2 bits, k = (m/n)*ln(2) hashes
+        self.num_bits = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+
+    def _bit_positions(self, item):
+        # Double hashing: derive all k positions from two 64-bit halves
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'big')
+        h2 = int.from_bytes(digest[8:], 'big')
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, item):
+        for pos in self._bit_positions(item):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item):
+        return all(self.bits[pos >> 3] & (1 << (pos & 7))
+                   for pos in self._bit_positions(item))
+
+
+class WorkQueue:
+    """Unbounded queue on a bare deque, with asyncio.Queue's join semantics.
+
+    asyncio.Queue pays several Python-level frames and internal bookkeeping
+    per put/get, which adds up over millions of URLs. In a single-threaded
+    event loop a deque needs no locking; waiter futures stand in for the
+    condition variable, and puts hand items straight to a waiting getter.
+    """
+
+    def __init__(self):
+        self._items = deque()
+        self._getters = deque()
+        self._unfinished = 0
+        self._finished = asyncio.Event()
+        self._finished.set()
+
+    def put_nowait(self, item):
+        self._unfinished += 1
+        self._finished.clear()
+        # Hand the item directly to a waiting getter when there is one
+        while self._getters:
+            getter = self._getters.popleft()
+            if not getter.cancelled():
+                getter.set_result(item)
+                return
+        self._items.append(item)
+
+    async def get(self):
+        if self._items:
+            return self._items.popleft()
+        getter = asyncio.get_running_loop().create_future()
+        self._getters.append(getter)
+        return await getter
+
+    def drain(self):
+        """Pop and return everything currently queued, without waiting."""
+        items = list(self._items)
+        self._items.clear()
+        return items
+
+    def task_done(self):
+        self._unfinished -= 1
+        if self._unfinished == 0:
+            self._finished.set()
+
+    async def join(self):
+        """Wait until every queued item has been marked done."""
+        await self._finished.wait()
+
+    def qsize(self):
+        return len(self._items)
+
+
+class TokenBucket:
+    """Global request rate limiter for the event loop.
+
+    Each worker sleeping delay seconds before its own fetch throttled the
+    crawl to num_threads/delay while the network sat idle. A shared token
+    bucket enforces the same politeness rate across all workers, so only
+    the worker whose token hasn't accrued yet waits.
+    """
+
+    def __init__(self, rate, burst=1):
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = burst
+        self.timestamp = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a token is available, then consume it."""
+        async with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity,
+                              self.tokens + (now - self.timestamp) * self.rate)
+            self.timestamp = now
+            if self.tokens < 1:
+                # Sleep exactly until the next token accrues; holding the
+                # lock keeps waiters FIFO
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+                self.timestamp = time.monotonic()
+                self.tokens = 0
+            else:
+                self.tokens -= 1
 
 
 class WebCrawler:
@@ -82,7 +289,7 @@ class WebCrawler:
         Args:
             start_url (str): The starting URL to crawl
             output_dir (str): Directory to save the extracted text
-            num_threads (int): Number of crawler threads
+            num_threads (int): Number of concurrent fetch workers
             delay (float): Delay between requests to the same domain (seconds)
         """
         self.start_url = start_url
@@ -101,20 +308,34 @@ class WebCrawler:
         os.makedirs(self.html_dir, exist_ok=True)
         os.makedirs(self.text_dir, exist_ok=True)
         
-        # Set for tracking visited URLs
-        self.visited_urls = set()
-        self.url_queue = queue.Queue()
-        
+        # Bloom filter for tracking visited URLs (bits per entry, not bytes)
+        self.visited_urls = BloomFilter()
+        self.url_queue = WorkQueue()
+
+        # Pending (filename, content) writes drained by the writer task
+        self.write_queue = WorkQueue()
+
         # Add the start URL to the queue
-        self.url_queue.put(start_url)
+        self.url_queue.put_nowait(start_url)
         self.visited_urls.add(start_url)
-        
-        # Create a lock for thread safety
-        self.lock = threading.Lock()
-        
+
+        # Shared aiohttp session and parse pool; created in crawl() once the
+        # event loop runs
+        self.session = None
+        self.parse_pool = None
+
+        # One politeness rate for the whole crawl instead of a sleep per worker
+        self.rate_limiter = TokenBucket(rate=1.0 / delay) if delay > 0 else None
+
+        # Validator cache for conditional GETs: maps URL to the ETag /
+        # Last-Modified the server sent last crawl, so unchanged pages come
+        # back as 304 with no body to download, parse or write
+        self.etag_db = shelve.open(os.path.join(output_dir, 'etag_cache'))
+
         # Statistics
         self.processed_count = 0
         self.failed_count = 0
+        self.not_modified_count = 0
         
         # User agent list for rotating
         self.user_agents = [
@@ -123,11 +344,15 @@ class WebCrawler:
             'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:89.0) Gecko/20100101 Firefox/89.0',
             'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/92.0.4515.107 Safari/537.36'
         ]
+        # Rotate agents round-robin; next() on a cycle is a plain C call,
+        # unlike random.choice which goes through the Mersenne Twister
+        self._ua_cycle = itertools.cycle(self.user_agents)
     
     def get_safe_filename(self, url):
         """Convert a URL to a safe filename."""
-        # Remove the protocol and domain
-        parsed_url = urlparse(url)
+        # Remove the protocol and domain (cached; validation warms a
+        # separate per-process cache in the parse-pool workers)
+        parsed_url = _urlparse(url)
         path = parsed_url.path
         
         # Handle the path
@@ -135,175 +360,233 @@ class WebCrawler:
             path = '/index'
         
         # Replace unsafe characters
-        safe_name = re.sub(r'[^a-zA-Z0-9_-]', '_', path)
-        
+        safe_name = _UNSAFE_CHARS_RE.sub('_', path)
+
         # Add query parameters (encoded) if they exist
         if parsed_url.query:
-            query_hash = abs(hash(parsed_url.query)) % 10000
-            safe_name += f'_query_{query_hash}'
-        
+            safe_name += f'_query_{_stable_hash(parsed_url.query)}'
+
         # Ensure the filename isn't too long
         if len(safe_name) > 200:
-            safe_name = safe_name[:190] + f'_hash_{abs(hash(url)) % 10000}'
+            safe_name = safe_name[:190] + f'_hash_{_stable_hash(url)}'
         
         return safe_name + '.txt'
     
-    def is_valid_url(self, url):
-        """Check if the URL is valid and belongs to the target domain."""
-        try:
-            # Parse the URL
-            parsed_url = urlparse(url)
-            
-            # Check if the URL has the same domain
-            if parsed_url.netloc != self.domain:
-                return False
-            
-            # Check if the URL scheme is http or https
-            if parsed_url.scheme not in ['http', 'https']:
-                return False
-            
-            # Avoid common non-HTML resources
-            path = parsed_url.path.lower()
-            if any(path.endswith(ext) for ext in ['.jpg', '.jpeg', '.png', '.gif', '.pdf', 
-                                                   '.zip', '.tar', '.gz', '.mp3', '.mp4', 
-                                                   '.avi', '.mov', '.css', '.js']):
-                return False
-            
-            return True
-        except:
-            return False
-    
-    def extract_links(self, url, html_content):
-        """Extract all links from the HTML content."""
-        links = set()
-        try:
-            soup = BeautifulSoup(html_content, 'html.parser')
-            for a_tag in soup.find_all('a', href=True):
-                link = a_tag['href']
-                
-                # Convert relative URLs to absolute URLs
-                absolute_link = urljoin(url, link)
-                
-                # Check if the URL is valid
-                if self.is_valid_url(absolute_link):
-                    links.add(absolute_link)
-        except Exception as e:
-            print(f"Error extracting links from {url}: {e}")
-        
-        return links
-    
-    def process_url(self, url):
+    async def process_url(self, url):
         """Process a single URL: download, save HTML, extract text, and find links."""
         try:
-            # Add a small random delay to be polite
-            time.sleep(self.delay * (0.5 + random.random()))
-            
+            # Respect the politeness rate without idling every worker
+            if self.rate_limiter:
+                await self.rate_limiter.acquire()
+
             # Rotate user agents
             headers = {
-                'User-Agent': random.choice(self.user_agents),
+                'User-Agent': next(self._ua_cycle),
                 'Accept': 'text/html,application/xhtml+xml,application/xml',
+                'Accept-Encoding': _ACCEPT_ENCODING,
                 'Accept-Language': 'en-US,en;q=0.9',
                 'Connection': 'keep-alive'
             }
-            
+
+            # Send the validators from the previous crawl, if any, so the
+            # server can answer 304 Not Modified for unchanged pages
+            cached = self.etag_db.get(url)
+            if cached:
+                if cached.get('etag'):
+                    headers['If-None-Match'] = cached['etag']
+                if cached.get('last_modified'):
+                    headers['If-Modified-Since'] = cached['last_modified']
+
             # Download the page
-            response = requests.get(url, headers=headers, timeout=10)
-            
-            # Check if the response is HTML
-            content_type = response.headers.get('Content-Type', '').lower()
-            if 'text/html' not in content_type:
-                print(f"Skipping non-HTML content at {url} (Content-Type: {content_type})")
-                return
-            
-            # Get the HTML content
-            html_content = response.text
-            
+            async with self.session.get(url, headers=headers,
+                                        timeout=aiohttp.ClientTimeout(total=10)) as response:
+                # Unchanged since last crawl: nothing to download or parse,
+                # but the page's links (cached alongside the validators)
+                # still have to propagate the frontier, or the crawl would
+                # stop dead at every unchanged page
+                if response.status == 304:
+                    for link in cached.get('links', ()):
+                        if link not in self.visited_urls:
+                            self.url_queue.put_nowait(link)
+                            self.visited_urls.add(link)
+                    self.not_modified_count += 1
+                    return
+
+                # This response's validators, cached for the next crawl
+                # once the page's links are known
+                etag = response.headers.get('ETag')
+                last_modified = response.headers.get('Last-Modified')
+
+                # Check if the response is HTML
+                content_type = response.headers.get('Content-Type', '').lower()
+                if 'text/html' not in content_type:
+                    logger.info("Skipping non-HTML content at %s (Content-Type: %s)",
+                                url, content_type)
+                    return
+
+                # Get the raw HTML bytes; selectolax handles the encoding
+                # itself, so decoding (and charset detection) here would be
+                # wasted CPU
+                html_bytes = await response.read()
+
             # Generate safe filenames
             safe_name = self.get_safe_filename(url)
             html_filename = os.path.join(self.html_dir, safe_name.replace('.txt', '.html'))
             text_filename = os.path.join(self.text_dir, safe_name)
-            
-            # Save the HTML file
-            with open(html_filename, 'w', encoding='utf-8') as f:
-                f.write(html_content)
-            
-            # Extract and save the text
-            extracted_text = extract_text_from_html(html_content)
-            with open(text_filename, 'w', encoding='utf-8') as f:
-                f.write(extracted_text)
-            
-            # Extract links
-            links = self.extract_links(url, html_content)
-            
+
+            # Hand writes to the writer task so workers never block on disk
+            self.write_queue.put_nowait((html_filename, html_bytes))
+
+            # Parse in a worker process: tree construction holds the GIL,
+            # so keeping it in-process would serialize the fetch workers
+            loop = asyncio.get_running_loop()
+            extracted_text, links = await loop.run_in_executor(
+                self.parse_pool, parse_page, html_bytes, url, self.domain)
+            self.write_queue.put_nowait((text_filename, extracted_text))
+
+            # Remember the validators and link set so a 304 on the next
+            # crawl can skip the body yet still walk past this page
+            if etag or last_modified:
+                self.etag_db[url] = {'etag': etag,
+                                     'last_modified': last_modified,
+                                     'links': sorted(links)}
+
             # Add new links to the queue
-            with self.lock:
-                for link in links:
-                    if link not in self.visited_urls:
-                        self.url_queue.put(link)
-                        self.visited_urls.add(link)
-                
-                # Update statistics
-                self.processed_count += 1
-                
-                # Print progress
-                if self.processed_count % 10 == 0 or self.processed_count < 10:
-                    print(f"Processed: {self.processed_count} | Queue: {self.url_queue.qsize()} | Failed: {self.failed_count}")
-            
-            print(f"Processed: {url} -> {text_filename}")
-                
-        except RequestException as e:
-            with self.lock:
-                self.failed_count += 1
-            print(f"Request error for {url}: {e}")
+            for link in links:
+                if link not in self.visited_urls:
+                    self.url_queue.put_nowait(link)
+                    self.visited_urls.add(link)
+
+            # Update statistics
+            self.processed_count += 1
+
+            # Log progress
+            if self.processed_count % 10 == 0 or self.processed_count < 10:
+                logger.info("Processed: %d | Queue: %d | Failed: %d",
+                            self.processed_count, self.url_queue.qsize(),
+                            self.failed_count)
+
+            logger.info("Processed: %s -> %s", url, text_filename)
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self.failed_count += 1
+            logger.error("Request error for %s: %s", url, e)
         except Exception as e:
-            with self.lock:
-                self.failed_count += 1
-            print(f"Error processing {url}: {e}")
-    
-    def worker(self):
-        """Worker thread that processes URLs from the queue."""
+            self.failed_count += 1
+            logger.error("Error processing %s: %s", url, e)
+
+    @staticmethod
+    def _write_batch(batch):
+        """Write a batch of (filename, content) pairs (runs in an executor thread).
+
+        Returns the number of writes that failed; a bad item must not take
+        the rest of the batch (or the writer task) down with it.
+        """
+        failed = 0
+        for filename, content in batch:
+            try:
+                if isinstance(content, bytes):
+                    # Raw page bytes are written as-is; no decode/re-encode cycle
+                    with open(filename, 'wb') as f:
+                        f.write(content)
+                else:
+                    with open(filename, 'w', encoding='utf-8') as f:
+                        f.write(content)
+            except OSError as e:
+                failed += 1
+                logger.error("Error writing %s: %s", filename, e)
+        return failed
+
+    async def file_writer(self):
+        """Writer task that drains the write queue in batches.
+
+        Batching amortizes the executor hand-off and keeps all disk I/O in
+        one thread instead of two open/write/close round-trips per worker
+        per page.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            # Block for the first pending write, then grab whatever else
+            # has accumulated so the whole batch costs one executor trip
+            batch = [await self.write_queue.get()]
+            batch.extend(self.write_queue.drain())
+
+            try:
+                self.failed_count += await loop.run_in_executor(
+                    None, self._write_batch, batch)
+            except Exception as e:
+                self.failed_count += len(batch)
+                logger.error("Writer error: %s", e)
+            finally:
+                # Always account for the batch so write_queue.join() (and
+                # with it the whole crawl) can't hang on a failed write
+                for _ in batch:
+                    self.write_queue.task_done()
+
+    async def worker(self):
+        """Worker task that processes URLs from the queue."""
         while True:
+            # Get a URL from the queue
+            url = await self.url_queue.get()
             try:
-                # Get a URL from the queue with a timeout
-                url = self.url_queue.get(timeout=2)
-                
                 # Process the URL
-                self.process_url(url)
-                
+                await self.process_url(url)
+            except Exception as e:
+                logger.error("Worker error: %s", e)
+            finally:
                 # Mark the task as done
                 self.url_queue.task_done()
-            except queue.Empty:
-                # No more URLs in the queue for the timeout period
-                # Check if other threads are still working
-                with self.lock:
-                    if self.url_queue.empty():
-                        break
-            except Exception as e:
-                print(f"Worker error: {e}")
-    
-    def crawl(self):
-        """Start the crawling process with multiple threads."""
-        print(f"Starting crawler with {self.num_threads} threads")
-        print(f"Domain: {self.domain}")
-        print(f"Output directories: {self.html_dir} and {self.text_dir}")
-        
-        # Create and start worker threads
-        threads = []
-        for i in range(self.num_threads):
-            thread = threading.Thread(target=self.worker)
-            thread.daemon = True
-            thread.start()
-            threads.append(thread)
-        
-        # Wait for all threads to finish
-        for thread in threads:
-            thread.join()
-        
-        print("\nCrawling completed!")
-        print(f"Total pages processed: {self.processed_count}")
-        print(f"Failed requests: {self.failed_count}")
-        print(f"HTML saved to: {self.html_dir}")
-        print(f"Extracted text saved to: {self.text_dir}")
+
+    async def crawl(self):
+        """Start the crawling process with concurrent worker tasks."""
+        # Workers only enqueue log records; the listener thread does the
+        # actual stream writes, so logging never blocks the event loop
+        log_queue = queue.SimpleQueue()
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        logger.setLevel(logging.INFO)
+        listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler())
+        listener.start()
+
+        logger.info("Starting crawler with %d workers", self.num_threads)
+        logger.info("Domain: %s", self.domain)
+        logger.info("Output directories: %s and %s", self.html_dir, self.text_dir)
+
+        # One pooled session for the whole crawl; keep-alive connections are
+        # reused across requests to the target host
+        connector = aiohttp.TCPConnector(limit_per_host=self.num_threads,
+                                         keepalive_timeout=30)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            self.session = session
+
+            # Parse pool: fetch workers stay on the event loop while HTML
+            # parsing runs on separate cores
+            self.parse_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+
+            # Spawn the worker tasks and the single file-writer task
+            workers = [asyncio.create_task(self.worker())
+                       for i in range(self.num_threads)]
+            writer = asyncio.create_task(self.file_writer())
+
+            # Wait until every queued URL has been processed and every
+            # pending write has hit disk, then stop the tasks
+            await self.url_queue.join()
+            await self.write_queue.join()
+            for task in workers + [writer]:
+                task.cancel()
+            await asyncio.gather(*workers, writer, return_exceptions=True)
+            self.parse_pool.shutdown()
+
+        self.etag_db.close()
+
+        logger.info("\nCrawling completed!")
+        logger.info("Total pages processed: %d", self.processed_count)
+        logger.info("Unchanged pages (304): %d", self.not_modified_count)
+        logger.info("Failed requests: %d", self.failed_count)
+        logger.info("HTML saved to: %s", self.html_dir)
+        logger.info("Extracted text saved to: %s", self.text_dir)
+
+        # Drain any buffered records before the process exits
+        listener.stop()
 
 
 def main():
@@ -312,7 +595,7 @@ def main():
     parser.add_argument('--output-dir', '-o', default='./crawled_data', 
                         help='Directory to save the extracted text (default: ./crawled_data)')
     parser.add_argument('--threads', '-t', type=int, default=5,
-                        help='Number of crawler threads (default: 5)')
+                        help='Number of concurrent fetch workers (default: 5)')
     parser.add_argument('--delay', '-d', type=float, default=1.0,
                         help='Delay between requests to the same domain in seconds (default: 1.0)')
     
@@ -333,7 +616,7 @@ def main():
     
     # Create and run the crawler
     crawler = WebCrawler(args.start_url, args.output_dir, args.threads, args.delay)
-    crawler.crawl()
+    asyncio.run(crawler.crawl())
 
 
 if __name__ == "__main__":